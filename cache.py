@@ -0,0 +1,66 @@
+import logging
+import sqlite3
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import fastjson
+
+CACHE_FILE = '.lc_cache'
+CACHE_TTL = 7 * 24 * 60 * 60  # one week, in seconds
+
+logger = logging.getLogger(__name__)
+
+class ProblemCache:
+    """SQLite backed store of fetched problems, keyed by title slug."""
+
+    def __init__(self, path: str = CACHE_FILE, ttl: int = CACHE_TTL):
+        self.path = Path(path)
+        self.ttl = ttl
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the cache database on first use."""
+        if self._conn is None:
+            self._conn = sqlite3.connect(self.path)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS cache ("
+                "slug TEXT PRIMARY KEY, problem_json TEXT NOT NULL, fetched_at INTEGER NOT NULL)"
+            )
+        return self._conn
+
+    def get(self, slug: str) -> Optional[Dict]:
+        """Return the cached problem for a slug, or None if missing or expired."""
+        try:
+            row = self._connect().execute(
+                "SELECT problem_json FROM cache WHERE slug = ? AND fetched_at >= ?",
+                (slug, int(time.time()) - self.ttl)
+            ).fetchone()
+            return fastjson.loads(row[0]) if row else None
+        except (sqlite3.Error, ValueError) as e:
+            logger.warning(f"Ignoring unreadable cache entry for '{slug}': {e}")
+            return None
+
+    def put(self, slug: str, problem: Dict):
+        """Store a problem for a slug, replacing any previous entry."""
+        try:
+            with self._connect() as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO cache (slug, problem_json, fetched_at) VALUES (?, ?, ?)",
+                    (slug, fastjson.dumps(problem).decode('utf-8'), int(time.time()))
+                )
+        except sqlite3.Error as e:
+            logger.warning(f"Could not cache problem '{slug}': {e}")
+
+    def invalidate(self, slugs: Optional[List[str]] = None) -> int:
+        """Remove the given slugs, or every entry if none are given. Returns the number removed."""
+        try:
+            with self._connect() as conn:
+                if slugs is None:
+                    cursor = conn.execute("DELETE FROM cache")
+                else:
+                    cursor = conn.executemany("DELETE FROM cache WHERE slug = ?", [(slug,) for slug in slugs])
+                return cursor.rowcount
+        except sqlite3.Error as e:
+            logger.warning(f"Could not invalidate cache: {e}")
+            return 0
@@ -1,37 +1,77 @@
 import os
 from pathlib import Path
-import json
+import fastjson
+
+try:
+    import keyring
+    from keyring.errors import KeyringError
+except ImportError:
+    keyring = None
 
 CONFIG_FILE = 'config.json'
+KEYRING_SERVICE = 'leetcode_mcp'
+KEYRING_USERNAME = 'openai'
 
-def load_api_key():
-    """Load OpenAI API key from config file."""
-    config_path = Path(CONFIG_FILE)
-    
-    # If config file exists, load key from it
-    if config_path.exists():
-        try:
-            with open(config_path, 'r') as f:
-                config = json.load(f)
-                return config.get('OPENAI_API_KEY')
-        except:
-            pass
-    
-    # If no key found, prompt user
+def _read_config():
+    """Read the config file, returning None if it is missing or not valid JSON."""
+    try:
+        return fastjson.loads(Path(CONFIG_FILE).read_bytes())
+    except (FileNotFoundError, fastjson.JSONDecodeError):
+        return None
+
+def _load_from_json():
+    """Load the API key from the config file, if one is stored there."""
+    config = _read_config()
+    return config.get('OPENAI_API_KEY') if isinstance(config, dict) else None
+
+def _load_from_keyring():
+    """Load the API key from the OS keyring, if keyring is installed and has a backend."""
+    if keyring is None:
+        return None
+    try:
+        return keyring.get_password(KEYRING_SERVICE, KEYRING_USERNAME)
+    except KeyringError:
+        return None
+
+def _save_to_keyring(api_key: str) -> bool:
+    """Store the API key in the OS keyring, returning whether it succeeded."""
+    if keyring is None:
+        return False
+    try:
+        keyring.set_password(KEYRING_SERVICE, KEYRING_USERNAME, api_key)
+        return True
+    except KeyringError:
+        return False
+
+def _prompt_and_save():
+    """Ask the user for an API key and remember it for next time."""
     print("\nOpenAI API key not found. Please enter your API key:")
     api_key = input("> ").strip()
-    
-    # Save to config file
-    with open(config_path, 'w') as f:
-        json.dump({'OPENAI_API_KEY': api_key}, f)
-    
+    save_api_key(api_key)
     return api_key
 
+def load_api_key():
+    """Load OpenAI API key from the environment, OS keyring or config file, prompting as a last resort."""
+    return (
+        os.environ.get('OPENAI_API_KEY')
+        or _load_from_keyring()
+        or _load_from_json()
+        or _prompt_and_save()
+    )
+
 def save_api_key(api_key: str):
-    """Save OpenAI API key to config file."""
+    """Save OpenAI API key to the OS keyring, or atomically to the config file if no keyring is available."""
+    if _save_to_keyring(api_key):
+        return
+    
+    if _load_from_json() == api_key:
+        return
+    
+    # Write a sibling temp file and swap it in so a crash never leaves a truncated config
     config_path = Path(CONFIG_FILE)
-    with open(config_path, 'w') as f:
-        json.dump({'OPENAI_API_KEY': api_key}, f)
+    tmp_path = config_path.with_suffix('.json.tmp')
+    tmp_path.write_bytes(fastjson.dumps({'OPENAI_API_KEY': api_key}))
+    os.replace(tmp_path, config_path)
 
 def update_api_key():
     """Update the OpenAI API key."""
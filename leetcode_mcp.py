@@ -1,19 +1,79 @@
-import requests
+import argparse
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import functools
+import httpx
 import json
 from typing import Dict, List, Optional
 import logging
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass, field
 from datetime import datetime
 import os
-from openai import OpenAI
+from openai import APIConnectionError, APIStatusError, OpenAI
 from config import load_api_key
+import fastjson
+from cache import ProblemCache
 import time
 import random
+import re
 
-logging.basicConfig(level=logging.INFO)
+_LOG_LEVEL = (os.environ.get("LEETCODE_LOG_LEVEL") or "INFO").upper()
+# getLevelName maps known level names to ints and echoes anything else back as a string
+_LOG_LEVEL_VALID = isinstance(logging.getLevelName(_LOG_LEVEL), int)
+logging.basicConfig(level=_LOG_LEVEL if _LOG_LEVEL_VALID else logging.INFO)
 logger = logging.getLogger(__name__)
+if not _LOG_LEVEL_VALID:
+    logger.warning(f"Unknown LEETCODE_LOG_LEVEL '{_LOG_LEVEL}', using INFO")
 
-@dataclass
+# Maps a problem title to its URL slug: spaces become dashes, ASCII letters are lowercased
+_SLUG_TABLE = str.maketrans({" ": "-", **{chr(c): chr(c + 32) for c in range(ord("A"), ord("Z") + 1)}})
+
+# Patterns for pulling examples and constraints out of a problem's content
+_EXAMPLE_RE = re.compile(r"Example\s*\d*:(.*?)(?=Example\s*\d*:|Constraints:|\Z)", re.S)
+_FIELD_RE = re.compile(r"(Input|Output|Explanation):[ \t]*(.*)")
+_CONSTRAINT_RE = re.compile(r"^[ \t]*\*[ \t]*(.+)$", re.M)
+
+# Outermost JSON object in a model reply that wrapped it in prose or code fences
+_JSON_OBJECT_RE = re.compile(r"\{.*\}", re.S)
+
+# GraphQL query to get problem details, shared by single and batched fetches
+_GET_QUESTION_QUERY = """
+query getQuestionDetail($titleSlug: String!) {
+    question(titleSlug: $titleSlug) {
+        questionId
+        title
+        difficulty
+        content
+        exampleTestcases
+        topicTags {
+            name
+        }
+        codeSnippets {
+            langSlug
+            code
+        }
+    }
+}
+"""
+_QUERY_TEMPLATE = {"operationName": "getQuestionDetail", "query": _GET_QUESTION_QUERY}
+
+# Connection pool for LeetCode requests and the responses worth retrying
+_HTTP_LIMITS = httpx.Limits(max_connections=64, max_keepalive_connections=32)
+_RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+# OpenAI statuses worth retrying, matching the SDK's own retry rules (plus any 5xx)
+_OPENAI_RETRY_STATUSES = {408, 409, 429}
+
+# Completion budget per generated solution, and the model's output token limit
+_MAX_TOKENS_PER_SOLUTION = 2000
+_MAX_COMPLETION_TOKENS = 4096
+# Problems per completion, so each keeps its full token budget
+_PROBLEMS_PER_COMPLETION = _MAX_COMPLETION_TOKENS // _MAX_TOKENS_PER_SOLUTION
+
+# Approach name of real model output, as opposed to the quota-exceeded template
+_AI_SOLUTION_NAME = "AI Generated Solution"
+
+@dataclass(slots=True)
 class Solution:
     approach_name: str
     intuition: str
@@ -22,7 +82,7 @@ class Solution:
     code: str
     explanation: str
 
-@dataclass
+@dataclass(slots=True)
 class LeetCodeProblem:
     title: str
     difficulty: str
@@ -30,69 +90,182 @@ class LeetCodeProblem:
     examples: List[Dict[str, str]]
     constraints: List[str]
     solutions: List[Solution]
+    code_snippets: List[Dict[str, str]] = field(default_factory=list)
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "LeetCodeProblem":
+        """Rebuild a problem, including its solutions, from ``dataclasses.asdict`` output."""
+        fields = dict(data)
+        fields["solutions"] = [Solution(**s) for s in fields["solutions"]]
+        return cls(**fields)
+
+def _extract_json(text: str) -> Dict:
+    """Parse a JSON object from model output, tolerating surrounding prose or code fences."""
+    try:
+        return fastjson.loads(text)
+    except fastjson.JSONDecodeError:
+        match = _JSON_OBJECT_RE.search(text)
+        if not match:
+            raise
+        return fastjson.loads(match.group(0))
+
+@functools.cache
+def _openai_client() -> OpenAI:
+    """Process-wide OpenAI client, so every LeetCodeMCP shares one connection pool."""
+    return OpenAI(api_key=load_api_key())
 
 class LeetCodeMCP:
     def __init__(self):
         self.graphql_url = "https://leetcode.com/graphql"
-        self.session = requests.Session()
+        self._http_client: Optional[httpx.AsyncClient] = None
+        self.cache = ProblemCache()
         self.headers = {
             "Content-Type": "application/json",
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
             "Referer": "https://leetcode.com/problems/"
         }
-        # Initialize OpenAI client with API key from config
-        api_key = load_api_key()
-        self.client = OpenAI(api_key=api_key)
     
-    def _sanitize_problem_name(self, name: str) -> str:
+    @functools.cached_property
+    def client(self) -> OpenAI:
+        """OpenAI client shared by all instances, created (and the API key loaded) on first use."""
+        return _openai_client()
+    
+    @property
+    def http_client(self) -> httpx.AsyncClient:
+        """Lazily create the shared async HTTP client for LeetCode requests."""
+        if self._http_client is None:
+            self._http_client = httpx.AsyncClient(
+                headers=self.headers,
+                transport=httpx.AsyncHTTPTransport(limits=_HTTP_LIMITS, retries=3)
+            )
+        return self._http_client
+    
+    async def aclose(self):
+        """Close the async HTTP client if it was created."""
+        if self._http_client is not None:
+            await self._http_client.aclose()
+            self._http_client = None
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def _sanitize_problem_name(name: str) -> str:
         """Convert problem name to leetcode URL format."""
-        return name.lower().replace(" ", "-")
+        return name.translate(_SLUG_TABLE)
     
-    def generate_solution(self, problem: LeetCodeProblem) -> Optional[Solution]:
+    def _call_openai_with_backoff(self, max_retry: int = 6, base_delay: float = 1.0, max_delay: float = 60.0, **kwargs):
         """
-        Generate a solution using OpenAI's API with rate limit handling.
+        Create a chat completion, retrying rate limits, server errors and connection
+        failures with exponential backoff and jitter.
         """
-        try:
-            # Construct the prompt
-            prompt = f"""Given this LeetCode problem:
-
-Title: {problem.title}
-Difficulty: {problem.difficulty}
+        # The SDK's built-in retries are disabled so this loop is the only retry layer
+        client = self.client.with_options(max_retries=0)
+        for attempt in range(max_retry + 1):
+            try:
+                return client.chat.completions.create(**kwargs)
+            except (APIStatusError, APIConnectionError) as e:
+                status = getattr(e, "status_code", None)
+                retryable = status is None or status in _OPENAI_RETRY_STATUSES or status >= 500
+                # An exhausted quota will not recover by waiting
+                if not retryable or e.code == "insufficient_quota" or attempt == max_retry:
+                    raise
+                
+                response = getattr(e, "response", None)
+                retry_after = response.headers.get("retry-after") if response is not None else None
+                try:
+                    delay = min(max_delay, float(retry_after))
+                except (TypeError, ValueError):
+                    delay = min(max_delay, base_delay * 2 ** attempt) * (1 - random.random() * 0.25)
+                
+                logger.warning(f"OpenAI request failed ({status or e.__class__.__name__}), retrying in {delay:.1f}s (attempt {attempt + 1}/{max_retry})")
+                time.sleep(delay)
 
-Description:
-{problem.description}
+    def generate_solutions(self, problems: List[LeetCodeProblem]) -> List[Optional[Solution]]:
+        """
+        Generate solutions for several problems, returned in the same order as the
+        problems. Problems are sent in concurrent sub-batches of
+        _PROBLEMS_PER_COMPLETION, so K problems make ceil(K / 2) OpenAI requests.
+        """
+        batches = [
+            problems[i:i + _PROBLEMS_PER_COMPLETION]
+            for i in range(0, len(problems), _PROBLEMS_PER_COMPLETION)
+        ]
+        if not batches:
+            return []
+        if len(batches) == 1:
+            return self._generate_solution_batch(problems)
+        
+        with ThreadPoolExecutor(max_workers=len(batches)) as pool:
+            batch_solutions = pool.map(self._generate_solution_batch, batches)
+            return [solution for solutions in batch_solutions for solution in solutions]
 
-Examples:
-{chr(10).join(f"Example {i+1}:" + chr(10) + f"Input: {ex.get('input', 'N/A')}" + chr(10) + f"Output: {ex.get('output', 'N/A')}" + (chr(10) + f"Explanation: {ex['explanation']}" if 'explanation' in ex else '') for i, ex in enumerate(problem.examples))}
+    def _generate_solution_batch(self, problems: List[LeetCodeProblem]) -> List[Optional[Solution]]:
+        """
+        Generate solutions for a sub-batch of problems with a single OpenAI completion.
+        """
+        try:
+            # Construct the prompt
+            problems_json = json.dumps([
+                {
+                    "title": problem.title,
+                    "difficulty": problem.difficulty,
+                    "description": problem.description,
+                    "examples": problem.examples,
+                    "constraints": problem.constraints
+                }
+                for problem in problems
+            ], indent=2)
+            prompt = f"""Solve each of these {len(problems)} LeetCode problem(s):
 
-Constraints:
-{chr(10).join('- ' + c for c in problem.constraints)}"""
+{problems_json}"""
 
             try:
-                # Get completion from OpenAI
-                completion = self.client.chat.completions.create(
+                # Stream the completion from OpenAI
+                completion = self._call_openai_with_backoff(
                     model="gpt-3.5-turbo",  # Changed from gpt-4o to gpt-3.5-turbo
                     messages=[
-                        {"role": "system", "content": "You are an expert programmer helping to solve LeetCode problems. Provide clear, efficient solutions with detailed explanations."},
+                        {"role": "system", "content": (
+                            "You are an expert programmer helping to solve LeetCode problems. Provide clear, efficient solutions with detailed explanations. "
+                            'Respond with a single JSON object of the form {"solutions": [...]}, holding one solution per problem in the order given. '
+                            'Each solution is an object of the form {"intuition": str, "time_complexity": str, '
+                            '"space_complexity": str, "code": str, "explanation": str}, where "code" is a Python solution.'
+                        )},
                         {"role": "user", "content": prompt}
                     ],
                     temperature=0.7,
-                    max_tokens=2000
+                    max_tokens=min(_MAX_TOKENS_PER_SOLUTION * len(problems), _MAX_COMPLETION_TOKENS),
+                    response_format={"type": "json_object"},
+                    stream=True
                 )
+                chunks = []
+                finish_reason = None
+                for chunk in completion:
+                    if chunk.choices:
+                        chunks.append(chunk.choices[0].delta.content or "")
+                        finish_reason = chunk.choices[0].finish_reason or finish_reason
+
+                if finish_reason == "length":
+                    logger.error(f"AI response for {len(problems)} problem(s) was truncated at the token limit")
+                    return [None] * len(problems)
 
                 # Parse the response
-                response_text = completion.choices[0].message.content
-                print("\nParsing AI response...")
-                solution_data = json.loads(response_text)
-
-                return Solution(
-                    approach_name="AI Generated Solution",
-                    intuition=solution_data["intuition"],
-                    time_complexity=solution_data["time_complexity"],
-                    space_complexity=solution_data["space_complexity"],
-                    code=solution_data["code"],
-                    explanation=solution_data["explanation"]
-                )
+                response_text = "".join(chunks)
+                logger.debug("Parsing AI response")
+                solutions_data = _extract_json(response_text).get("solutions", [])
+
+                solutions: List[Optional[Solution]] = [None] * len(problems)
+                for i, solution_data in enumerate(solutions_data[:len(problems)]):
+                    try:
+                        solutions[i] = Solution(
+                            approach_name=_AI_SOLUTION_NAME,
+                            intuition=solution_data["intuition"],
+                            time_complexity=solution_data["time_complexity"],
+                            space_complexity=solution_data["space_complexity"],
+                            code=solution_data["code"],
+                            explanation=solution_data["explanation"]
+                        )
+                    except (KeyError, TypeError) as e:
+                        logger.error(f"Malformed AI solution for '{problems[i].title}': {e}")
+                return solutions
 
             except Exception as e:
                 error_msg = str(e)
@@ -103,74 +276,119 @@ Constraints:
                     print("2. Wait for your quota to reset")
                     print("3. Use a different API key")
                     
-                    # Return a basic template solution instead
-                    return Solution(
-                        approach_name="Template Solution",
-                        intuition="Please implement your solution here",
-                        time_complexity="Analyze the time complexity of your solution",
-                        space_complexity="Analyze the space complexity of your solution",
-                        code=next(
-                            (s["code"] for s in problem.codeSnippets 
-                             if s["langSlug"] == "python3"), 
-                            "def solution():\n    # Implement your solution here\n    pass"
-                        ),
-                        explanation="Add a detailed explanation of your approach"
-                    )
+                    # Return basic template solutions instead
+                    return [
+                        Solution(
+                            approach_name="Template Solution",
+                            intuition="Please implement your solution here",
+                            time_complexity="Analyze the time complexity of your solution",
+                            space_complexity="Analyze the space complexity of your solution",
+                            code=next(
+                                (s["code"] for s in problem.code_snippets 
+                                 if s["langSlug"] == "python3"), 
+                                "def solution():\n    # Implement your solution here\n    pass"
+                            ),
+                            explanation="Add a detailed explanation of your approach"
+                        )
+                        for problem in problems
+                    ]
                 elif "429" in error_msg:
                     print("\nError: Rate limit reached. Please try again in a few minutes.")
                 else:
                     print(f"\nError generating solution: {error_msg}")
-                return None
+                return [None] * len(problems)
 
         except Exception as e:
             print(f"Unexpected error: {str(e)}")
-            return None
+            return [None] * len(problems)
 
-    def get_problem(self, problem_name: str) -> Optional[LeetCodeProblem]:
+    def generate_solution(self, problem: LeetCodeProblem) -> Optional[Solution]:
         """
-        Fetch problem details using LeetCode's GraphQL API.
+        Generate a solution using OpenAI's API with rate limit handling.
         """
-        try:
-            # GraphQL query to get problem details
-            query = """
-            query getQuestionDetail($titleSlug: String!) {
-                question(titleSlug: $titleSlug) {
-                    questionId
-                    title
-                    difficulty
-                    content
-                    exampleTestcases
-                    topicTags {
-                        name
-                    }
-                    codeSnippets {
-                        langSlug
-                        code
-                    }
-                }
-            }
-            """
+        return self.generate_solutions([problem])[0]
+
+    async def _post_graphql(self, payload, max_retry: int = 3, backoff_factor: float = 0.5, max_delay: float = 30.0) -> httpx.Response:
+        """
+        POST to the GraphQL endpoint, retrying 429 and 5xx responses with exponential backoff.
+        """
+        for attempt in range(max_retry + 1):
+            response = await self.http_client.post(self.graphql_url, json=payload)
+            if response.status_code not in _RETRY_STATUSES or attempt == max_retry:
+                return response
             
-            variables = {
+            retry_after = response.headers.get("retry-after")
+            try:
+                delay = min(max_delay, float(retry_after))
+            except (TypeError, ValueError):
+                delay = min(max_delay, backoff_factor * 2 ** attempt)
+            
+            logger.warning(f"LeetCode returned {response.status_code}, retrying in {delay:.1f}s (attempt {attempt + 1}/{max_retry})")
+            await asyncio.sleep(delay)
+
+    def _question_payload(self, problem_name: str) -> Dict:
+        """Build the GraphQL operation that fetches a single problem."""
+        return {
+            **_QUERY_TEMPLATE,
+            "variables": {
                 "titleSlug": self._sanitize_problem_name(problem_name)
             }
-            
-            response = self.session.post(
-                self.graphql_url,
-                headers=self.headers,
-                json={
-                    "query": query,
-                    "variables": variables
-                }
-            )
-            
-            # Print response status and headers for debugging
-            print(f"Response Status: {response.status_code}")
-            print(f"Response Headers: {response.headers}")
-            
-            response.raise_for_status()
-            
-            data = response.json()
+        }
+    
+    def _parse_question(self, question_data: Dict) -> LeetCodeProblem:
+        """Extract examples and constraints from a GraphQL question payload."""
+        # Parse examples from the content
+        examples = []
+        content = question_data["content"]
+        for block in _EXAMPLE_RE.finditer(content):
+            example = {
+                match.group(1).lower(): match.group(2).strip()
+                for match in _FIELD_RE.finditer(block.group(1))
+            }
+            if example:
+                examples.append(example)
+        
+        # Extract constraints
+        _, found, constraints_section = content.partition("Constraints:")
+        constraints = [
+            match.group(1).strip("* ")
+            for match in _CONSTRAINT_RE.finditer(constraints_section)
+        ] if found else []
+        
+        return LeetCodeProblem(
+            title=question_data["title"],
+            difficulty=question_data["difficulty"],
+            description=content,
+            examples=examples,
+            constraints=constraints,
+            solutions=[],
+            code_snippets=question_data.get("codeSnippets") or []
+        )
+    
+    def _cached_problem(self, problem_name: str) -> Optional[LeetCodeProblem]:
+        """Return a previously fetched problem from the disk cache, if still fresh."""
+        slug = self._sanitize_problem_name(problem_name)
+        cached = self.cache.get(slug)
+        if cached is None:
+            return None
+        try:
+            problem = LeetCodeProblem.from_dict(cached)
+        except (KeyError, TypeError) as e:
+            # Written by an older schema; drop it and refetch
+            logger.warning(f"Discarding stale cache entry for '{problem_name}': {e}")
+            self.cache.invalidate([slug])
+            return None
+        logger.info(f"Loaded '{problem_name}' from cache")
+        return problem
+    
+    def invalidate_cache(self, problem_names: Optional[List[str]] = None) -> int:
+        """Drop the given problems from the disk cache, or all of them if none are given."""
+        slugs = [self._sanitize_problem_name(name) for name in problem_names] if problem_names else None
+        return self.cache.invalidate(slugs)
+    
+    def _question_from_result(self, problem_name: str, data: Dict) -> Optional[LeetCodeProblem]:
+        """Turn one GraphQL result into a problem, logging errors and unknown problems."""
+        try:
             if "errors" in data:
                 logger.error(f"GraphQL Error: {data['errors']}")
                 return None
@@ -180,58 +398,55 @@ Constraints:
                 logger.error(f"Problem '{problem_name}' not found")
                 return None
             
-            # Parse examples from the content
-            examples = []
-            content = question_data["content"]
-            example_sections = content.split("Example")[1:]
-            for i, section in enumerate(example_sections, 1):
-                example = {}
-                lines = section.strip().split("\n")
-                for line in lines:
-                    if "Input:" in line:
-                        example["input"] = line.split("Input:")[1].strip()
-                    elif "Output:" in line:
-                        example["output"] = line.split("Output:")[1].strip()
-                    elif "Explanation:" in line:
-                        example["explanation"] = line.split("Explanation:")[1].strip()
-                if example:
-                    examples.append(example)
+            return self._parse_question(question_data)
             
-            # Extract constraints
-            constraints = []
-            if "Constraints:" in content:
-                constraints_section = content.split("Constraints:")[1].split("\n")
-                for line in constraints_section:
-                    if line.strip().startswith("*"):
-                        constraints.append(line.strip("* "))
-            
-            # Create default solutions list
-            solutions = []
-            
-            # Generate AI solution
-            ai_solution = self.generate_solution(LeetCodeProblem(
-                title=question_data["title"],
-                difficulty=question_data["difficulty"],
-                description=question_data["content"],
-                examples=examples,
-                constraints=constraints,
-                solutions=[]
-            ))
+        except Exception as e:
+            logger.error(f"Error parsing problem: {e}")
+            print(f"Full error details: {str(e)}")
+            return None
 
-            
+    async def _solve_problems(self, problem_names: List[str], problems: List[Optional[LeetCodeProblem]]) -> List[Optional[LeetCodeProblem]]:
+        """Attach AI generated solutions to the parsed problems and cache the solved ones."""
+        found = [(name, problem) for name, problem in zip(problem_names, problems) if problem]
+        if not found:
+            return problems
+        
+        # Create the OpenAI client here, on the event loop, so a worker
+        # thread is never the one to prompt for the key
+        _ = self.client
+        
+        # Generate AI solutions without blocking the event loop
+        ai_solutions = await asyncio.to_thread(self.generate_solutions, [problem for _, problem in found])
+        for (name, problem), ai_solution in zip(found, ai_solutions):
             if ai_solution:
-                solutions.append(ai_solution)
+                problem.solutions.append(ai_solution)
+                # Only cache real model output, never the quota-exceeded template
+                if ai_solution.approach_name == _AI_SOLUTION_NAME:
+                    self.cache.put(self._sanitize_problem_name(name), asdict(problem))
+        
+        return problems
+
+    async def get_problem(self, problem_name: str) -> Optional[LeetCodeProblem]:
+        """
+        Fetch problem details using LeetCode's GraphQL API, serving from the disk cache when possible.
+        """
+        cached = self._cached_problem(problem_name)
+        if cached:
+            return cached
+        return (await self._fetch_problems([problem_name]))[0]
+
+    async def _fetch_question_data(self, problem_name: str) -> Optional[Dict]:
+        """Fetch the raw GraphQL result for a single problem."""
+        try:
+            response = await self._post_graphql(self._question_payload(problem_name))
             
-            return LeetCodeProblem(
-                title=question_data["title"],
-                difficulty=question_data["difficulty"],
-                description=question_data["content"],
-                examples=examples,
-                constraints=constraints,
-                solutions=solutions
-            )
+            logger.debug("status=%s headers=%s", response.status_code, response.headers)
             
-        except requests.RequestException as e:
+            response.raise_for_status()
+            
+            return response.json()
+            
+        except httpx.HTTPError as e:
             logger.error(f"Network error: {e}")
             print(f"Full error details: {str(e)}")
             return None
@@ -240,75 +455,160 @@ Constraints:
             print(f"Full error details: {str(e)}")
             return None
 
+    async def get_problems(self, problem_names: List[str]) -> List[Optional[LeetCodeProblem]]:
+        """
+        Fetch several problems, preserving the input order. Cached problems are
+        served from disk and the rest are fetched with one batched request.
+        """
+        problems = [self._cached_problem(name) for name in problem_names]
+        missing = [i for i, problem in enumerate(problems) if problem is None]
+        
+        fetched = await self._fetch_problems([problem_names[i] for i in missing])
+        for i, problem in zip(missing, fetched):
+            problems[i] = problem
+        
+        return problems
+
+    async def _fetch_problems(self, problem_names: List[str]) -> List[Optional[LeetCodeProblem]]:
+        """
+        Fetch problems from LeetCode with a single batched GraphQL request and
+        solve them with a single OpenAI completion, bypassing the cache.
+        """
+        if len(problem_names) <= 1:
+            results = [await self._fetch_question_data(name) for name in problem_names]
+        else:
+            results = await self._fetch_question_batch(problem_names)
+        
+        problems = [
+            self._question_from_result(name, data) if data is not None else None
+            for name, data in zip(problem_names, results)
+        ]
+        return await self._solve_problems(problem_names, problems)
+
+    async def _fetch_question_batch(self, problem_names: List[str]) -> List[Optional[Dict]]:
+        """Fetch the raw GraphQL results for several problems in one request."""
+        try:
+            response = await self._post_graphql([self._question_payload(name) for name in problem_names])
+            
+            logger.debug("status=%s headers=%s", response.status_code, response.headers)
+            
+            # Servers with batching disabled reject array payloads with a 4xx;
+            # a rate limit that outlived the retries is not worth multiplying
+            if 400 <= response.status_code < 500 and response.status_code != 429:
+                results = None
+            else:
+                response.raise_for_status()
+                results = response.json()
+            
+        except httpx.HTTPError as e:
+            logger.error(f"Network error: {e}")
+            print(f"Full error details: {str(e)}")
+            return [None] * len(problem_names)
+        except Exception as e:
+            logger.error(f"Error parsing problems: {e}")
+            print(f"Full error details: {str(e)}")
+            return [None] * len(problem_names)
+        
+        if not isinstance(results, list) or len(results) != len(problem_names):
+            # Endpoint did not honour the batch (4xx, or an errors object
+            # instead of an array); fall back to concurrent single fetches
+            logger.warning("Batched GraphQL request not supported, fetching problems individually")
+            return await asyncio.gather(*(self._fetch_question_data(name) for name in problem_names))
+        
+        return results
+
     def explain_solutions(self, problem: LeetCodeProblem) -> str:
         """Generate a detailed explanation of all solutions for a problem."""
-        explanation = f"# {problem.title}\n\n"
-        explanation += f"Difficulty: {problem.difficulty}\n\n"
-        explanation += "## Problem Description\n\n"
-        explanation += f"{problem.description}\n\n"
+        parts: List[str] = [
+            f"# {problem.title}\n\n",
+            f"Difficulty: {problem.difficulty}\n\n",
+            "## Problem Description\n\n",
+            f"{problem.description}\n\n",
+        ]
         
-        explanation += "## Examples\n\n"
+        parts.append("## Examples\n\n")
         for i, example in enumerate(problem.examples, 1):
-            explanation += f"### Example {i}\n"
-            explanation += f"Input: {example.get('input', 'N/A')}\n"
-            explanation += f"Output: {example.get('output', 'N/A')}\n"
+            parts.append(f"### Example {i}\n")
+            parts.append(f"Input: {example.get('input', 'N/A')}\n")
+            parts.append(f"Output: {example.get('output', 'N/A')}\n")
             if 'explanation' in example:
-                explanation += f"Explanation: {example['explanation']}\n"
-            explanation += "\n"
+                parts.append(f"Explanation: {example['explanation']}\n")
+            parts.append("\n")
         
-        explanation += "## Constraints\n\n"
+        parts.append("## Constraints\n\n")
         for constraint in problem.constraints:
-            explanation += f"- {constraint}\n"
-        explanation += "\n"
+            parts.append(f"- {constraint}\n")
+        parts.append("\n")
         
-        explanation += "## Solutions\n\n"
+        parts.append("## Solutions\n\n")
         for i, solution in enumerate(problem.solutions, 1):
-            explanation += f"### Solution {i}: {solution.approach_name}\n\n"
-            explanation += "#### Intuition\n"
-            explanation += f"{solution.intuition}\n\n"
-            explanation += "#### Complexity Analysis\n"
-            explanation += f"- Time Complexity: {solution.time_complexity}\n"
-            explanation += f"- Space Complexity: {solution.space_complexity}\n\n"
-            explanation += "#### Implementation\n"
-            explanation += f"```python\n{solution.code}\n```\n\n"
-            explanation += "#### Detailed Explanation\n"
-            explanation += f"{solution.explanation}\n\n"
+            parts.append(
+                f"### Solution {i}: {solution.approach_name}\n\n"
+                "#### Intuition\n"
+                f"{solution.intuition}\n\n"
+                "#### Complexity Analysis\n"
+                f"- Time Complexity: {solution.time_complexity}\n"
+                f"- Space Complexity: {solution.space_complexity}\n\n"
+                "#### Implementation\n"
+                f"```python\n{solution.code}\n```\n\n"
+                "#### Detailed Explanation\n"
+                f"{solution.explanation}\n\n"
+            )
         
-        return explanation
+        return "".join(parts)
 
-def main():
-    mcp = LeetCodeMCP()
-    
-    while True:
-        print("\nLeetCode Problem Explorer")
-        print("1. Search for a problem")
-        print("2. Exit")
-        
-        choice = input("\nEnter your choice (1-2): ")
-        
-        if choice == "2":
-            break
-        elif choice == "1":
-            problem_name = input("\nEnter LeetCode problem name (e.g., 'two-sum' or 'valid sudoku'): ")
-            print("\nFetching problem details...")
+async def _explore(mcp: LeetCodeMCP):
+    try:
+        while True:
+            print("\nLeetCode Problem Explorer")
+            print("1. Search for a problem")
+            print("2. Exit")
             
-            problem = mcp.get_problem(problem_name)
+            choice = input("\nEnter your choice (1-2): ")
             
-            if problem:
-                explanation = mcp.explain_solutions(problem)
-                print("\n" + explanation)
+            if choice == "2":
+                break
+            elif choice == "1":
+                names = input("\nEnter LeetCode problem name(s), comma-separated (e.g., 'two-sum' or 'valid sudoku, two sum'): ")
+                problem_names = [name.strip() for name in names.split(",") if name.strip()]
+                print("\nFetching problem details...")
+                
+                problems = await mcp.get_problems(problem_names)
                 
-                # Option to save to file
-                save = input("\nWould you like to save this explanation to a file? (y/n): ")
-                if save.lower() == 'y':
-                    filename = f"{problem_name}_explanation.md"
-                    with open(filename, 'w', encoding='utf-8') as f:
-                        f.write(explanation)
-                    print(f"\nExplanation saved to {filename}")
+                for problem_name, problem in zip(problem_names, problems):
+                    if problem:
+                        explanation = mcp.explain_solutions(problem)
+                        print("\n" + explanation)
+                        
+                        # Option to save to file
+                        save = input(f"\nWould you like to save the explanation for '{problem_name}' to a file? (y/n): ")
+                        if save.lower() == 'y':
+                            filename = f"{problem_name}_explanation.md"
+                            with open(filename, 'w', encoding='utf-8') as f:
+                                f.write(explanation)
+                            print(f"\nExplanation saved to {filename}")
+                    else:
+                        print(f"\nFailed to fetch details for '{problem_name}'. Please check the problem name and try again.")
             else:
-                print("\nFailed to fetch problem details. Please check the problem name and try again.")
-        else:
-            print("\nInvalid choice. Please try again.")
+                print("\nInvalid choice. Please try again.")
+    finally:
+        await mcp.aclose()
+
+def main():
+    parser = argparse.ArgumentParser(description="Explore LeetCode problems with AI generated solutions.")
+    parser.add_argument(
+        "--invalidate",
+        nargs="*",
+        metavar="PROBLEM",
+        help="remove the given problems (or every problem if none are given) from the local cache before starting"
+    )
+    args = parser.parse_args()
+    
+    mcp = LeetCodeMCP()
+    if args.invalidate is not None:
+        removed = mcp.invalidate_cache(args.invalidate)
+        print(f"Removed {removed} cached problem(s).")
+    asyncio.run(_explore(mcp))
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file